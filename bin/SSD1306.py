@@ -25,6 +25,13 @@ import logging
 # import SSD1306.I2C as I2C
 import smbus
 
+# numpy is optional: when present the framebuffer pack in image() is
+# vectorized, otherwise the pure python loop below is used
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Constants
 SSD1306_I2C_ADDRESS = 0x3C    # 011110+SA0+RW - 0x3C or 0x3D
 SSD1306_SETCONTRAST = 0x81
@@ -108,6 +115,19 @@ class SSD1306Base(object):
 
     def display(self):
         """Write display buffer to physical display."""
+        if hasattr(self._bus, 'write_bytes'):
+            # The pure python smbus does raw /dev/i2c writes with no block
+            # size limit, so the addressing commands go out as one
+            # transaction (Co=0 control byte, then all command bytes) and
+            # the whole framebuffer as a second one instead of one
+            # 16-byte block write per chunk.
+            self._bus.write_bytes(self._address, bytes([
+                0x00,                        # Co = 0, DC = 0: command stream
+                SSD1306_COLUMNADDR, 0, self.width-1,
+                SSD1306_PAGEADDR, 0, self._pages-1,
+            ]))
+            self._bus.write_bytes(self._address, bytes([0x40]) + bytes(self._buffer))
+            return
         self.command(SSD1306_COLUMNADDR)
         self.command(0)              # Column start address. (0 = reset)
         self.command(self.width-1)   # Column end address.
@@ -131,6 +151,13 @@ class SSD1306Base(object):
         if imwidth != self.width or imheight != self.height:
             raise ValueError('Image must be same dimensions as display ({0}x{1}).' \
                 .format(self.width, self.height))
+        if numpy is not None:
+            # Vectorized pack: bit k of each page byte is the pixel k rows
+            # into the page, i.e. little-endian within the column byte.
+            pix = numpy.asarray(image, dtype=numpy.uint8)
+            pix = pix.reshape(self._pages, 8, self.width)
+            self._buffer = numpy.packbits(pix, axis=1, bitorder='little').flatten().tolist()
+            return
         # Grab all the pixels from the image, faster than getpixel.
         pix = image.load()
         # Iterate through the memory pages
@@ -1,6 +1,6 @@
 import datetime
+import functools
 import logging
-import textwrap
 import time
 
 from PIL import Image, ImageDraw, ImageFont, ImageOps
@@ -10,6 +10,20 @@ from bin.SSD1306 import SSD1309_128_64 as SSD1309
 from bin.Utils import Utils
 
 
+# control characters have no glyphs: tab becomes a space, the rest are
+# deleted in a single C-level translate pass before composition
+_SANITIZE_TABLE = str.maketrans(
+    '\t', ' ',
+    ''.join(map(chr, [*range(0x09), *range(0x0a, 0x20), 0x7f])))
+
+
+@functools.lru_cache(maxsize = None)
+def _load_font(size, is_bold = False):
+    """ Load a DejaVu font at the requested size, once per (size, bold). """
+    path = BaseScreen.font_bold_path if is_bold else BaseScreen.font_path
+    return ImageFont.truetype(path, int(size))
+
+
 class Display:
     DEFAULT_BUSNUM = 1
     SCREENSHOT_PATH = "./img/examples/"
@@ -34,10 +48,31 @@ class Display:
         self.width = self.device.width
         self.height = self.device.height
         self.rotate = rotate
+        # resolve the rotate option once instead of per frame: bool is an
+        # int subclass, so the old isinstance check in show() made the
+        # default rotate=False take a pointless rotate-by-0 copy each frame
+        if isinstance(rotate, int) and not isinstance(rotate, bool) and rotate % 360 != 0:
+            self._rotate_angle = rotate % 360
+        else:
+            self._rotate_angle = None
 
         self.image = Image.new("1", (self.width, self.height))
         self.draw = ImageDraw.Draw(self.image)
         self.screenshot = screenshot
+        # normalise the screenshot directory once; None doubles as the
+        # "screenshots disabled" fast-path marker
+        if screenshot:
+            dir = screenshot if isinstance(screenshot, str) else Display.SCREENSHOT_PATH
+            self._screenshot_dir = dir.rstrip('/')
+        else:
+            self._screenshot_dir = None
+        self._last_time_second = None
+        self._last_time_str = None
+        self._last_since_string = None
+        self._last_since_epoch = None
+        # (screen name, text lines) of the frame currently on the panel;
+        # lets a screen skip re-uploading a frame the device already shows
+        self._last_shown = None
 
     def clear(self):
         self.device.begin()
@@ -45,30 +80,43 @@ class Display:
         self.device.display()
 
     def prepare(self):
-        self.draw.rectangle((0, 0, self.width, self.height), outline = 0, fill = 0)
+        # paste(0, box) is PIL's fast fill path; draw.rectangle goes through
+        # the generic outline/fill rasterizer for the same result
+        self.image.paste(0, (0, 0, self.width, self.height))
 
     def show(self):
-        if isinstance(self.rotate, int):
-            self.image = self.image.rotate(self.rotate)
-            self.draw = ImageDraw.Draw(self.image)
+        # any upload invalidates the panel-contents key until the caller
+        # records what it drew (render_with_defaults does, after this)
+        self._last_shown = None
+        # rotate into a throwaway copy for the device so self.image (and the
+        # ImageDraw bound to it) stay stable for the lifetime of the display
+        image = self.image
+        if self._rotate_angle is not None:
+            if self._rotate_angle == 180:
+                # transpose is a straight memory remap in C, much cheaper
+                # than the affine resampling path taken by rotate()
+                image = image.transpose(Image.Transpose.ROTATE_180)
+            else:
+                image = image.rotate(self._rotate_angle)
 
-        self.device.image(self.image)
+        self.device.image(image)
         self.device.display()
 
     def capture_screenshot(self, name):
-        if self.screenshot:
-            if isinstance(self.screenshot, str):
-                dir = self.screenshot
-            else:
-                dir = Display.SCREENSHOT_PATH
+        if self._screenshot_dir is None:
+            return
 
-            path = dir.rstrip('/') + '/' + name.lower() + '.png'
-            self.logger.info("saving screenshot to '" + path + "'")
-            self.image.save(path)
+        path = self._screenshot_dir + '/' + name.lower() + '.png'
+        self.logger.info("saving screenshot to '%s'", path)
+        self.image.save(path)
 
     def human_readable_time_now(self) -> str:
-         now = datetime.datetime.now(datetime.timezone.utc)
-         return "T["+now.strftime("%H:%M:%S")+"]"
+         # strftime only needs to re-run when the wall-clock second changes
+         now = int(time.time())
+         if now != self._last_time_second:
+             self._last_time_second = now
+             self._last_time_str = "T[" + time.strftime("%H:%M:%S", time.gmtime(now)) + "]"
+         return self._last_time_str
 
     def human_readable_time_since(self, date_string: str) -> str:
         """
@@ -83,17 +131,15 @@ class Display:
             A formatted string like "X m ago", "Y h ago", or "Z d ago"
             with two digits of precision.
         """
-        # Parse the input string into a timezone-aware datetime object.
-        past_date = datetime.datetime.fromisoformat(date_string)
-
-        # Get the current time in UTC to ensure an apples-to-apples comparison.
-        now = datetime.datetime.now(datetime.timezone.utc)
-
-         # Calculate the difference between now and the past date.
-        time_delta = now - past_date
+        # Parse the input string once: it is constant between reboots, so
+        # cache its epoch value and subtract from time.time() instead of
+        # building two datetime objects per call.
+        if date_string != self._last_since_string:
+            self._last_since_string = date_string
+            self._last_since_epoch = datetime.datetime.fromisoformat(date_string).timestamp()
 
         # Get the total number of seconds in the time difference.
-        total_seconds = time_delta.total_seconds()
+        total_seconds = time.time() - self._last_since_epoch
 
         # Determine the most appropriate unit (minutes, hours, or days).
         if total_seconds < 3600:  # Less than 1 hour
@@ -113,7 +159,20 @@ class Display:
 class BaseScreen:
     font_path = Utils.current_dir + "/fonts/DejaVuSans.ttf"
     font_bold_path = Utils.current_dir + "/fonts/DejaVuSans-Bold.ttf"
-    fonts = {}
+    _glyph_cache = {}
+    # decoded + resized icons by path; opening and resizing the PNG every
+    # set_icon call is wasted work since screens are rebuilt each cycle
+    _icon_cache = {}
+    # upper bound on characters per line by (width, size, is_bold)
+    _max_chars = {}
+    # y offsets for each supported line count
+    _TEXT_Y = {
+        1: (0,),
+        2: (0, 18),
+        3: (0, 11, 21),
+        4: (0, 11, 21, 31),
+        5: (0, 11, 21, 31, 41),
+    }
 
     def __init__(self, duration, display = Display(), utils = Utils(), config = None):
         self.display = display
@@ -121,8 +180,13 @@ class BaseScreen:
         self.utils = utils
         self.config = config
         self.font_size = 8
+        self._skip_show = False
+        self._pending_lines_key = None
+        self._frame_start = time.monotonic()
+        self.icon = None
+        self.icon_path = None
         self.logger = logging.getLogger('Screen')
-        self.logger.info("'" + self.__class__.__name__ + "' created")
+        self.logger.info("'%s' created", self.__class__.__name__)
 
     @property
     def name(self):
@@ -132,11 +196,15 @@ class BaseScreen:
         """ set the image for this screen """
         if not self.icon or self.icon_path != path:
            self.icon_path = path
-           img = Image.open(r"" + Utils.current_dir + self.icon_path)
-           # img = img.convert('RGBA') # MUST be in RGB mode for the OLED
-           # invert black icon to white (255) for OLED display
-           #self.icon = ImageOps.invert( self.icon )
-           self.icon = img.resize([30, 30])
+           icon = BaseScreen._icon_cache.get(path)
+           if icon is None:
+              img = Image.open(r"" + Utils.current_dir + path)
+              # img = img.convert('RGBA') # MUST be in RGB mode for the OLED
+              # invert black icon to white (255) for OLED display
+              #self.icon = ImageOps.invert( self.icon )
+              icon = img.resize([30, 30])
+              BaseScreen._icon_cache[path] = icon
+           self.icon = icon
 
 
     @property
@@ -155,20 +223,106 @@ class BaseScreen:
         if not text_lines:
            return
 
+        # elide the frame entirely when the panel provably still shows this
+        # exact frame: composition, rotation and the I2C framebuffer upload
+        # can all be skipped. The key lives on the shared display so an
+        # upload by any other screen in between voids it.
+        key = (self.name, tuple(text_lines))
+        if key == self.display._last_shown:
+           self._skip_show = True
+           return
+        self._pending_lines_key = key
+        self._skip_show = False
+
         # set the number of lines, which reconfigures fonts
         self.set_text_lines(len(text_lines))
-        font = self.font()
-
-        line = 0
-        for text in text_lines:
-           # display the text line at the correct x / y based on config
-           x = self.text_indent
-           y = self.text_y[line]
-           self.display.draw.text((x, y), text, font=font, fill=255)
-
-           line += 1
-           if line >= 6:
-              return # too many lines passed in!
+        ys = BaseScreen._TEXT_Y[self.text_lines]
+        max_chars = BaseScreen._max_chars_per_line(self.display.width, self.font_size)
+
+        # display each line at the correct x / y based on config
+        x = self.text_indent
+        for y, text in zip(ys, text_lines):
+           # paste the cached line bitmap (masked, so descenders from the
+           # previous line are not blanked out by this line's background)
+           rendered = BaseScreen._render_line(text[:max_chars], self.font_size)
+           self.display.image.paste(rendered, (x, y), rendered)
+
+    @staticmethod
+    @functools.lru_cache(maxsize = 256)
+    def _render_line(text, size, is_bold = False):
+        """ Render a single line of text into its own 1-bit image.
+            Cached so unchanged lines (hostname, IPs, last boot) skip
+            rasterization entirely on later frames. Novel lines (time,
+            CPU%, ping) are composed from the per-glyph atlas, so even
+            they never re-enter FreeType after warm-up. """
+        font = _load_font(size, is_bold)
+        ascent, descent = font.getmetrics()
+
+        text = text.translate(_SANITIZE_TABLE)
+        glyphs = [BaseScreen._glyph(char, size, is_bold) for char in text]
+
+        # size the canvas to the advances plus any right-side overhang of
+        # the final glyphs, so ink outside the advance box is not clipped
+        width, offset = 1, 0
+        for glyph, advance, left in glyphs:
+            width = max(width, offset + left + glyph.width)
+            offset += advance
+        width = max(width, offset)
+
+        image = Image.new("1", (width, ascent + descent))
+        offset = 0
+        for glyph, advance, left in glyphs:
+            image.paste(glyph, (offset + left, 0), glyph)
+            offset += advance
+        return image
+
+    @staticmethod
+    def _max_chars_per_line(width, size, is_bold = False):
+        """ Upper bound on how many characters can fit in `width` pixels.
+            Anything past it is guaranteed off-panel, so lines are sliced
+            to this bound before glyph composition rather than wrapped. """
+        key = (width, size, is_bold)
+        bound = BaseScreen._max_chars.get(key)
+        if bound is None:
+            font = _load_font(size, is_bold)
+            narrowest = min(font.getlength(chr(c)) for c in range(0x21, 0x7f))
+            bound = int(width / max(narrowest, 1)) + 1
+            BaseScreen._max_chars[key] = bound
+        return bound
+
+    @staticmethod
+    def _glyph(char, size, is_bold = False):
+        """ Look up (or rasterize once) a single glyph bitmap, its advance
+            width and its left bearing. The bitmap covers the glyph's ink
+            box — which can start left of the pen position or overhang the
+            advance (J, Y, v, f...) — while the advance is used purely for
+            cursor movement. The whole ASCII atlas fits in a few KB. """
+        key = (char, size, is_bold)
+        glyph = BaseScreen._glyph_cache.get(key)
+        if glyph is None:
+            font = _load_font(size, is_bold)
+            # quantize the advance to the pixel grid once, at cache time:
+            # positions then stay pure integer math and never drift with
+            # an accumulated sub-pixel fraction
+            advance = max(round(font.getlength(char)), 1)
+            ascent, descent = font.getmetrics()
+            # rasterize once onto a padded canvas and crop to the actual
+            # ink: font.getbbox can disagree with the hinted 1-bit raster
+            # by a pixel, so the real bitmap is the only reliable extent
+            pad = int(size)
+            canvas = Image.new("1", (advance + 2 * pad, ascent + descent))
+            ImageDraw.Draw(canvas).text((pad, 0), char, font=font, fill=255)
+            ink = canvas.getbbox()
+            if ink is None:
+                # blank glyph (space): a 1px empty column, advance still moves
+                image = Image.new("1", (1, ascent + descent))
+                left = 0
+            else:
+                image = canvas.crop((ink[0], 0, ink[2], ascent + descent))
+                left = ink[0] - pad
+            glyph = (image, advance, left)
+            BaseScreen._glyph_cache[key] = glyph
+        return glyph
 
     def set_text_lines(self, num_lines):
        """ Set the number of text lines that will be displayed. """
@@ -186,49 +340,30 @@ class BaseScreen:
           else:
              self.font_size = 13
 
-    @property
-    def text_y(self):
-        if self.text_lines == 1:
-           return [0]
-        elif self.text_lines == 2:
-           return [0, 18]
-        elif self.text_lines == 3:
-           return [0, 11, 21]
-        elif self.text_lines < 6:
-           return [0, 11, 21, 31, 41, 51]
-        else:
-           return None
-
     def font(self, size = None, is_bold = False):
         # default to the current screen's font size if none provided
         if not size:
            size = self.font_size
-
-        suffix = None
-        if is_bold:
-            suffix = '_bold'
-
-        key = 'font_{}{}'.format(str(size), suffix)
-
-        if key not in BaseScreen.fonts:
-            font = BaseScreen.font_path
-            if is_bold:
-                font = BaseScreen.font_bold_path
-
-            font = ImageFont.truetype(font, int(size))
-            BaseScreen.fonts[key] = font
-        return BaseScreen.fonts[key]
+        return _load_font(size, is_bold)
 
     # helper function to display the current page (used by standard screens)
     def render_with_defaults(self):
-        self.capture_screenshot()
-        self.display.show()
-        time.sleep(self.duration)
+        if not self._skip_show:
+            self.capture_screenshot()
+            self.display.show()
+            self.display._last_shown = self._pending_lines_key
+        # sleep only the remainder of this screen's time slot: entity
+        # fetches and rendering already consumed part of it, so the cycle
+        # keeps a steady cadence instead of drifting by the render cost
+        remaining = self.duration - (time.monotonic() - self._frame_start)
+        if remaining > 0:
+            time.sleep(remaining)
 
     def render(self):
         self.display.show()
 
     def run(self):
+        self._frame_start = time.monotonic()
         self.display.prepare()
         self.render()
 
@@ -239,39 +374,57 @@ class ExitScreen(BaseScreen):
       self.render_with_defaults()
        
 class StatusScreen(BaseScreen):
+    ENTITY_IDS = (
+        "sensor.system_monitor_memory_usage",
+        "sensor.system_monitor_processor_use",
+        "sensor.system_monitor_disk_usage",
+        "sensor.system_monitor_processor_temperature",
+        "sensor.system_monitor_ipv4_address_end0",
+        "sensor.system_monitor_ipv4_address_wlan0",
+        "binary_sensor.8_8_8_8",
+        "sensor.8_8_8_8_round_trip_time_average",
+        "sensor.wan_download_speed_mbps",
+        "sensor.wan_upload_speed_mbps",
+        "sensor.system_monitor_last_boot",
+    )
+
     def render(self):
         hostname = self.utils.get_hostname()
         current_time = self.display.human_readable_time_now()
         hostname_line = f"{hostname} {current_time}"
 
-        mem = self.utils.get_hassio_entity("sensor.system_monitor_memory_usage", "state")
-        cpu = self.utils.get_hassio_entity("sensor.system_monitor_processor_use", "state")
-        disk = self.utils.get_hassio_entity("sensor.system_monitor_disk_usage", "state")
-        temp = self.utils.get_hassio_entity("sensor.system_monitor_processor_temperature", "state")
+        # one /api/states round-trip for every entity on this screen
+        entities = self.utils.get_hassio_entities(StatusScreen.ENTITY_IDS, "state")
+
+        mem = entities["sensor.system_monitor_memory_usage"]
+        cpu = entities["sensor.system_monitor_processor_use"]
+        disk = entities["sensor.system_monitor_disk_usage"]
+        temp = entities["sensor.system_monitor_processor_temperature"]
         resource_line = f"C{cpu}% M{mem}% D{disk}% t{temp}°C"
 
-        ip_eth = self.utils.get_hassio_entity("sensor.system_monitor_ipv4_address_end0", "state")
-        ip_wlan = self.utils.get_hassio_entity("sensor.system_monitor_ipv4_address_wlan0", "state")
+        ip_eth = entities["sensor.system_monitor_ipv4_address_end0"]
+        ip_wlan = entities["sensor.system_monitor_ipv4_address_wlan0"]
         ip_line = f"A {ip_eth} {ip_wlan}"
 
-        ping_status = self.utils.get_hassio_entity("binary_sensor.8_8_8_8", "state")
-        ping_latency = self.utils.get_hassio_entity("sensor.8_8_8_8_round_trip_time_average", "state")
+        ping_status = entities["binary_sensor.8_8_8_8"]
+        ping_latency = entities["sensor.8_8_8_8_round_trip_time_average"]
         if ping_status == "on":
           ping_line = ping_latency
         else:
           ping_line = "XXX"
-        download_speed = self.utils.get_hassio_entity("sensor.wan_download_speed_mbps", "state")
-        upload_speed = self.utils.get_hassio_entity("sensor.wan_upload_speed_mbps", "state")
+        download_speed = entities["sensor.wan_download_speed_mbps"]
+        upload_speed = entities["sensor.wan_upload_speed_mbps"]
         wan = f'P{ping_line} U{upload_speed} D{download_speed}'
 
-        last_boot = self.utils.get_hassio_entity("sensor.system_monitor_last_boot", "state")
+        last_boot = entities["sensor.system_monitor_last_boot"]
         boot_since = self.display.human_readable_time_since(last_boot)
         boot = f"B {boot_since}"
-        self.logger.info(hostname_line)
-        self.logger.info(ip_line)
-        self.logger.info(resource_line)
-        self.logger.info(wan)
-        self.logger.info(boot)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(hostname_line)
+            self.logger.info(ip_line)
+            self.logger.info(resource_line)
+            self.logger.info(wan)
+            self.logger.info(boot)
 
         self.display_text([ hostname_line, resource_line, ip_line, wan, boot ])
         self.render_with_defaults()
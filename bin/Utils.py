@@ -71,47 +71,66 @@ class Utils:
         return slug
         
 class HassioUtils(Utils):
+    API_STATES_URL = 'http://supervisor/core/api/states'
+    # formatted per-entity URLs never change for the lifetime of the
+    # process, so build them once instead of per request
+    _api_urls = {}
+    # persistent session: keep-alive to the supervisor avoids a fresh TCP
+    # handshake per fetch, and carries the auth headers set on it once
+    _session = None
+
     @staticmethod
     def hassos_get_info(type):
         url = 'http://supervisor/{}'.format(type)
-        Utils.logger.info("Requesting data from '" + url + "'")
+        Utils.logger.info("Requesting data from '%s'", url)
         cmd = 'curl -sSL -H "Authorization: Bearer $SUPERVISOR_TOKEN" -H "Content-Type: application/json" ' + url
         info = Utils.shell_cmd(cmd)
         return json.loads(info)
 
     @staticmethod
     def hassos_get_api_object(type):
-        token = os.environ.get('SUPERVISOR_TOKEN')
-        if token is None:
-            Utils.logger.warning("SUPERVISOR_TOKEN environment variable not set.")
-            return None
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        }
+        url = HassioUtils._api_urls.get(type)
+        if url is None:
+            url = '{}/{}'.format(HassioUtils.API_STATES_URL, type)
+            HassioUtils._api_urls[type] = url
+        return HassioUtils._hassos_api_get(url, type)
+
+    @staticmethod
+    def _hassos_api_get(url, label):
+        session = HassioUtils._session
+        if session is None:
+            token = os.environ.get('SUPERVISOR_TOKEN')
+            if token is None:
+                Utils.logger.warning("SUPERVISOR_TOKEN environment variable not set.")
+                return None
+            session = requests.Session()
+            session.headers.update({
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            })
+            HassioUtils._session = session
 
-        url = 'http://supervisor/core/api/states/{}'.format(type)
         try:
             # Make the network request
-            response = requests.get(url, headers=headers, timeout=5)
-            
+            response = session.get(url, timeout=5)
+
             # This line will raise an exception for 4xx or 5xx errors (like 401, 404)
-            response.raise_for_status() 
-            
-            info = response.json() 
-            
+            response.raise_for_status()
+
+            info = response.json()
+
             #Utils.logger.info("---sss--- Command output " + str(info))
             return info
 
         except requests.exceptions.HTTPError as e:
-            Utils.logger.warning(f"HTTP Error for {type}: {e}")
+            Utils.logger.warning(f"HTTP Error for {label}: {e}")
         except requests.exceptions.RequestException as e:
             # This catches connection errors, timeouts, etc.
-            Utils.logger.warning(f"Error requesting {type}: {e}")
+            Utils.logger.warning(f"Error requesting {label}: {e}")
         except Exception as e:
             # Catch any other unexpected errors (like .json() failing)
-            Utils.logger.warning(f"Failed to get or parse data for {type}: {e}")
-            
+            Utils.logger.warning(f"Failed to get or parse data for {label}: {e}")
+
         return None
 
     @staticmethod
@@ -171,6 +190,25 @@ class HassioUtils(Utils):
         except Exception as e:
             Utils.logger.warning("Could not load hassio info url '"+ url +"': " + str(e))
 
+    @staticmethod
+    def get_hassio_entities(states, property):
+        '''
+            Fetch many entities with a single /api/states request instead
+            of one HTTP round-trip per entity. Returns a dict mapping each
+            requested state id to its property value (None when missing).
+        '''
+        results = dict.fromkeys(states)
+        info = HassioUtils._hassos_api_get(HassioUtils.API_STATES_URL, 'states')
+        if info:
+            wanted = set(states)
+            for entity in info:
+                entity_id = entity.get('entity_id')
+                if entity_id in wanted:
+                    results[entity_id] = entity.get(property)
+        else:
+            Utils.logger.warning("Could not batch load hassio states")
+        return results
+
     @staticmethod
     def get_hassio_entity(state, property):
         '''
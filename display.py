@@ -45,7 +45,7 @@ def start(config, logger):
 
     while True:
         for name in screens:
-            logger.info("'" + name + "' is being processed")
+            logger.info("'%s' is being processed", name)
             try:
                 screen = config.screen_factory(name)
                 screen.run()